@@ -8,6 +8,7 @@ modules = [
     "views.list",
     "views.create",
     "views.retrieve",
+    "views.batch_retrieve",
     "views.update",
     "views.patch",
     "views.delete",
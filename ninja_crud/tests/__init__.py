@@ -1,6 +1,7 @@
 from .request_components import AuthHeaders, PathParameters, Payloads, QueryParameters
 from .request_composer import RequestComposer
 from .test_abstract import AbstractModelViewTest
+from .test_batch_retrieve import BatchRetrieveModelViewTest
 from .test_create import CreateModelViewTest
 from .test_delete import DeleteModelViewTest
 from .test_list import ListModelViewTest
@@ -20,6 +21,7 @@ __all__ = [
     "ListModelViewTest",
     "CreateModelViewTest",
     "RetrieveModelViewTest",
+    "BatchRetrieveModelViewTest",
     "UpdateModelViewTest",
     "PatchModelViewTest",
     "DeleteModelViewTest",
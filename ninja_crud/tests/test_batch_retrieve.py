@@ -0,0 +1,106 @@
+import json
+from http import HTTPStatus
+
+from django.http import HttpResponse
+from django.test import tag
+
+from ninja_crud.tests.assertion_helper import TestAssertionHelper
+from ninja_crud.tests.request_components import AuthHeaders, QueryParameters
+from ninja_crud.tests.request_composer import (
+    ArgOrCallable,
+    RequestComposer,
+    TestCaseType,
+)
+from ninja_crud.tests.test_abstract import AbstractModelViewTest
+from ninja_crud.views.batch_retrieve import BatchRetrieveModelView
+
+
+class BatchRetrieveModelViewTest(AbstractModelViewTest):
+    model_view_class = BatchRetrieveModelView
+    model_view: BatchRetrieveModelView
+
+    def __init__(
+        self,
+        query_parameters: ArgOrCallable[QueryParameters, TestCaseType],
+        auth_headers: ArgOrCallable[AuthHeaders, TestCaseType] = None,
+    ) -> None:
+        self.request_composer = RequestComposer(
+            request_method=self.request_batch_retrieve_models,
+            query_parameters=query_parameters,
+            auth_headers=auth_headers,
+        )
+
+    def request_batch_retrieve_models(
+        self,
+        path_parameters: dict,
+        query_parameters: dict,
+        auth_headers: dict,
+        payload: dict,
+    ) -> HttpResponse:
+        path = "/" + self.model_view_set_test.base_path + self.model_view.get_path()
+        return self.model_view_set_test.client_class().get(
+            path=path,
+            data=query_parameters,
+            **auth_headers,
+        )
+
+    def assert_response_is_ok(self, response: HttpResponse, query_parameters: dict):
+        self.model_view_set_test.assertEqual(response.status_code, HTTPStatus.OK)
+        content = json.loads(response.content)
+        self.model_view_set_test.assertIsInstance(content, list)
+
+        queryset = self.model_view.get_queryset(
+            self.model_view_set_test.model_view_set_class.model_class
+        ).filter(pk__in=query_parameters["ids"])
+        self.model_view_set_test.assertEqual(len(content), queryset.count())
+
+        for item in content:
+            TestAssertionHelper.assert_content_equals_schema(
+                test_case=self.model_view_set_test,
+                content=item,
+                queryset=queryset,
+                output_schema=self.model_view.output_schema,
+            )
+
+    def assert_response_is_bad_request(
+        self, response: HttpResponse, status_code: HTTPStatus
+    ):
+        TestAssertionHelper.assert_response_is_bad_request(
+            self.model_view_set_test, response, status_code=status_code
+        )
+
+    @tag("batch_retrieve")
+    def test_batch_retrieve_models_ok(self):
+        self.request_composer.test_view_ok(
+            test_case=self.model_view_set_test,
+            completion_callback=lambda response, _, query_parameters, __, ___: self.assert_response_is_ok(
+                response, query_parameters=query_parameters
+            ),
+        )
+
+    @tag("batch_retrieve")
+    def test_batch_retrieve_models_bad_request(self):
+        self.request_composer.test_view_query_parameters_bad_request(
+            test_case=self.model_view_set_test,
+            completion_callback=lambda response, _, __, ___, ____: self.assert_response_is_bad_request(
+                response, status_code=HTTPStatus.BAD_REQUEST
+            ),
+        )
+
+    @tag("batch_retrieve")
+    def test_batch_retrieve_models_unauthorized(self):
+        self.request_composer.test_view_auth_headers_unauthorized(
+            test_case=self.model_view_set_test,
+            completion_callback=lambda response, _, __, ___, ____: self.assert_response_is_bad_request(
+                response, status_code=HTTPStatus.UNAUTHORIZED
+            ),
+        )
+
+    @tag("batch_retrieve")
+    def test_batch_retrieve_models_forbidden(self):
+        self.request_composer.test_view_auth_headers_forbidden(
+            test_case=self.model_view_set_test,
+            completion_callback=lambda response, _, __, ___, ____: self.assert_response_is_bad_request(
+                response, status_code=HTTPStatus.FORBIDDEN
+            ),
+        )
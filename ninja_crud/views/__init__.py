@@ -1,4 +1,5 @@
 from .abstract import AbstractModelView
+from .batch_retrieve import BatchRetrieveModelView
 from .create import CreateModelView
 from .delete import DeleteModelView
 from .list import ListModelView
@@ -13,6 +14,7 @@ __all__ = [
     "ListModelView",
     "CreateModelView",
     "RetrieveModelView",
+    "BatchRetrieveModelView",
     "UpdateModelView",
     "PatchModelView",
     "DeleteModelView",
@@ -4,6 +4,8 @@ from typing import Callable, List, Optional, Type
 from django.db.models import Model
 from ninja import Router
 
+from ninja_crud.views import utils
+
 
 class AbstractModelView(ABC):
     def __init__(
@@ -12,7 +14,18 @@ class AbstractModelView(ABC):
         if decorators is None:
             decorators = []
         self.decorators = decorators
+        self._merged_decorators: Optional[tuple] = None
+        self._merged_decorator_cache: Optional[Callable] = None
         self.router_kwargs = router_kwargs or {}
+        self._path: Optional[str] = None
+
+    @property
+    def _merged_decorator(self) -> Callable:
+        decorators = tuple(self.decorators)
+        if decorators != self._merged_decorators:
+            self._merged_decorators = decorators
+            self._merged_decorator_cache = utils.merge_decorators(decorators)
+        return self._merged_decorator_cache
 
     @abstractmethod
     def register_route(
@@ -20,6 +33,9 @@ class AbstractModelView(ABC):
     ) -> None:  # pragma: no cover
         pass
 
-    @abstractmethod
-    def get_path(self) -> str:  # pragma: no cover
-        pass
+    def get_path(self) -> str:
+        if self._path is None:
+            raise NotImplementedError(
+                f"{type(self).__name__} must set _path or override get_path"
+            )
+        return self._path
@@ -0,0 +1,66 @@
+from typing import Callable, List, Optional, Type
+
+from django.db.models import Model, QuerySet
+from django.http import HttpRequest
+from ninja import Query, Router, Schema
+
+from ninja_crud.views import utils
+from ninja_crud.views.abstract import AbstractModelView
+
+
+class BatchRetrieveModelView(AbstractModelView):
+    def __init__(
+        self,
+        output_schema: Type[Schema],
+        queryset_getter: Callable[[], QuerySet[Model]] = None,
+        select_related: List[str] = None,
+        prefetch_related: List[str] = None,
+        max_batch_size: int = 100,
+        decorators: List[Callable] = None,
+        router_kwargs: Optional[dict] = None,
+    ) -> None:
+        super().__init__(decorators=decorators, router_kwargs=router_kwargs)
+        self.output_schema = output_schema
+        self.queryset_getter = queryset_getter
+        self.select_related = select_related or []
+        self.prefetch_related = prefetch_related or []
+        self.max_batch_size = max_batch_size
+        self._path = "/batch/"
+
+    def register_route(self, router: Router, model_class: Type[Model]) -> None:
+        operation_id, summary = utils.get_route_meta(
+            "retrieve", model_class, plural=True
+        )
+
+        get_queryset = self.get_queryset
+        output_schema = self.output_schema
+        id_type = utils.get_id_type(model_class)
+        max_batch_size = self.max_batch_size
+
+        @router.get(
+            path=self.get_path(),
+            response={200: List[output_schema]},
+            operation_id=operation_id,
+            summary=summary,
+            **self.router_kwargs,
+        )
+        @self._merged_decorator
+        def batch_retrieve_models(
+            request: HttpRequest,
+            ids: List[id_type] = Query(..., max_items=max_batch_size),
+        ):
+            queryset = get_queryset(model_class).filter(pk__in=ids)
+            instances = {instance.pk: instance for instance in queryset}
+            return 200, [instances[id] for id in ids if id in instances]
+
+    def get_queryset(self, model_class: Type[Model]) -> QuerySet[Model]:
+        if self.queryset_getter is None:
+            queryset = model_class._default_manager.get_queryset()
+        else:
+            queryset = self.queryset_getter()
+
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        return queryset
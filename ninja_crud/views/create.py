@@ -1,4 +1,3 @@
-from http import HTTPStatus
 from typing import Any, Callable, List, Optional, Type, TypeVar, Union
 
 from django.db.models import Model
@@ -36,6 +35,10 @@ class CreateModelView(AbstractModelView):
         self.related_model = related_model
         self.pre_save = pre_save
         self.post_save = post_save
+        if self.detail:
+            self._path = f"/{{id}}/{utils.to_snake_case(self.related_model.__name__)}s/"
+        else:
+            self._path = "/"
 
     def register_route(self, router: Router, model_class: Type[Model]) -> None:
         if self.detail:
@@ -46,20 +49,19 @@ class CreateModelView(AbstractModelView):
     def register_collection_route(
         self, router: Router, model_class: Type[Model]
     ) -> None:
-        model_name = utils.to_snake_case(model_class.__name__)
-        operation_id = f"create_{model_name}"
+        operation_id, summary = utils.get_route_meta("create", model_class)
 
         input_schema = self.input_schema
         output_schema = self.output_schema
 
         @router.post(
             path=self.get_path(),
-            response={HTTPStatus.CREATED: output_schema},
+            response={201: output_schema},
             operation_id=operation_id,
-            summary=f"Create {model_class.__name__}",
+            summary=summary,
             **self.router_kwargs,
         )
-        @utils.merge_decorators(self.decorators)
+        @self._merged_decorator
         def create_model(request: HttpRequest, payload: input_schema):
             instance = model_class()
             for field, value in payload.dict(exclude_unset=True).items():
@@ -74,30 +76,30 @@ class CreateModelView(AbstractModelView):
             if self.post_save:
                 self.post_save(request, instance)
 
-            return HTTPStatus.CREATED, instance
+            return 201, instance
 
     def register_instance_route(self, router: Router, model_class: Type[Model]) -> None:
-        parent_model_name = utils.to_snake_case(model_class.__name__)
-        model_name = utils.to_snake_case(self.related_model.__name__)
-        operation_id = f"create_{parent_model_name}_{model_name}"
+        operation_id, summary = utils.get_route_meta(
+            "create", model_class, related_model=self.related_model
+        )
 
         input_schema = self.input_schema
         output_schema = self.output_schema
 
         @router.post(
             path=self.get_path(),
-            response={HTTPStatus.CREATED: output_schema},
+            response={201: output_schema},
             operation_id=operation_id,
-            summary=f"Create {self.related_model.__name__}",
+            summary=summary,
             **self.router_kwargs,
         )
-        @utils.merge_decorators(self.decorators)
+        @self._merged_decorator
         def create_model(
             request: HttpRequest,
             id: utils.get_id_type(model_class),
             payload: input_schema,
         ):
-            instance = model_class.objects.get(pk=id)
+            instance = model_class._default_manager.get(pk=id)
             related_instance = self.related_model()
             for field, value in payload.dict(exclude_unset=True).items():
                 setattr(related_instance, field, value)
@@ -111,10 +113,4 @@ class CreateModelView(AbstractModelView):
             if self.post_save:
                 self.post_save(request, instance.pk, related_instance)
 
-            return HTTPStatus.CREATED, related_instance
-
-    def get_path(self) -> str:
-        if self.detail:
-            return f"/{{id}}/{utils.to_snake_case(self.related_model.__name__)}s/"
-        else:
-            return "/"
+            return 201, related_instance
@@ -1,6 +1,6 @@
-from http import HTTPStatus
 from typing import Any, Callable, List, Optional, Type, TypeVar
 
+from django.core.cache.backends.base import BaseCache
 from django.db.models import Model
 from django.http import HttpRequest
 from ninja import Router
@@ -19,33 +19,38 @@ class DeleteModelView(AbstractModelView):
         decorators: List[Callable] = None,
         pre_delete: PreDeleteHook = None,
         post_delete: PostDeleteHook = None,
+        cache: Optional[BaseCache] = None,
         router_kwargs: Optional[dict] = None,
     ) -> None:
         super().__init__(decorators=decorators, router_kwargs=router_kwargs)
         self.pre_delete = pre_delete
         self.post_delete = post_delete
+        self.cache = cache
+        self._path = "/{id}"
 
     def register_route(self, router: Router, model_class: Type[Model]) -> None:
+        operation_id, summary = utils.get_route_meta("delete", model_class)
+
         @router.delete(
             path=self.get_path(),
-            response={HTTPStatus.NO_CONTENT: None},
-            operation_id=f"delete_{utils.to_snake_case(model_class.__name__)}",
-            summary=f"Delete {model_class.__name__}",
+            response={204: None},
+            operation_id=operation_id,
+            summary=summary,
             **self.router_kwargs,
         )
-        @utils.merge_decorators(self.decorators)
+        @self._merged_decorator
         def delete_model(request: HttpRequest, id: utils.get_id_type(model_class)):
-            instance = model_class.objects.get(pk=id)
+            instance = model_class._default_manager.get(pk=id)
 
             if self.pre_delete is not None:
                 self.pre_delete(request, instance)
 
             instance.delete()
 
+            if self.cache is not None:
+                utils.invalidate_cache(self.cache, model_class, id)
+
             if self.post_delete is not None:
                 self.post_delete(request, id)
 
-            return HTTPStatus.NO_CONTENT, None
-
-    def get_path(self) -> str:
-        return "/{id}"
+            return 204, None
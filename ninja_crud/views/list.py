@@ -1,4 +1,3 @@
-from http import HTTPStatus
 from typing import Any, Callable, List, Optional, Type, Union
 
 from django.db.models import Model, QuerySet
@@ -29,6 +28,10 @@ class ListModelView(AbstractModelView):
         self.queryset_getter = queryset_getter
         self.related_model = related_model
         self.detail = detail
+        if self.detail:
+            self._path = f"/{{id}}/{utils.to_snake_case(self.related_model.__name__)}s/"
+        else:
+            self._path = "/"
 
     def register_route(self, router: Router, model_class: Type[Model]) -> None:
         if self.detail:
@@ -39,21 +42,19 @@ class ListModelView(AbstractModelView):
     def register_collection_route(
         self, router: Router, model_class: Type[Model]
     ) -> None:
-        model_name = utils.to_snake_case(model_class.__name__)
-        operation_id = f"list_{model_name}s"
-        summary = f"List {model_class.__name__}s"
+        operation_id, summary = utils.get_route_meta("list", model_class, plural=True)
 
         output_schema = self.output_schema
         filter_schema = self.filter_schema
 
         @router.get(
             path=self.get_path(),
-            response={HTTPStatus.OK: List[output_schema]},
+            response={200: List[output_schema]},
             operation_id=operation_id,
             summary=summary,
             **self.router_kwargs,
         )
-        @utils.merge_decorators(self.decorators)
+        @self._merged_decorator
         @paginate(LimitOffsetPagination)
         def list_models(
             request: HttpRequest, filters: filter_schema = Query(default=FilterSchema())
@@ -62,29 +63,28 @@ class ListModelView(AbstractModelView):
             return self.filter_queryset(queryset=queryset, filters=filters)
 
     def register_instance_route(self, router: Router, model_class: Type[Model]) -> None:
-        parent_model_name = utils.to_snake_case(model_class.__name__)
-        related_model_name = utils.to_snake_case(self.related_model.__name__)
-        operation_id = f"list_{parent_model_name}_{related_model_name}s"
-        summary = f"List {self.related_model.__name__}s of a {model_class.__name__}"
+        operation_id, summary = utils.get_route_meta(
+            "list", model_class, plural=True, related_model=self.related_model
+        )
 
         output_schema = self.output_schema
         filter_schema = self.filter_schema
 
         @router.get(
             path=self.get_path(),
-            response={HTTPStatus.OK: List[output_schema]},
+            response={200: List[output_schema]},
             operation_id=operation_id,
             summary=summary,
             **self.router_kwargs,
         )
-        @utils.merge_decorators(self.decorators)
+        @self._merged_decorator
         @paginate(LimitOffsetPagination)
         def list_models(
             request: HttpRequest,
             id: utils.get_id_type(model_class),
             filters: filter_schema = Query(default=FilterSchema()),
         ):
-            instance = model_class.objects.get(pk=id)
+            instance = model_class._default_manager.get(pk=id)
             queryset = self.get_queryset(model_class, instance.pk)
             return self.filter_queryset(queryset=queryset, filters=filters)
 
@@ -93,12 +93,12 @@ class ListModelView(AbstractModelView):
             if self.queryset_getter is not None:
                 return self.queryset_getter(id)
             else:
-                return self.related_model.objects.get_queryset()
+                return self.related_model._default_manager.get_queryset()
         else:
             if self.queryset_getter is not None:
                 return self.queryset_getter()
             else:
-                return model_class.objects.get_queryset()
+                return model_class._default_manager.get_queryset()
 
     @staticmethod
     def filter_queryset(queryset: QuerySet[Model], filters: FilterSchema):
@@ -108,9 +108,3 @@ class ListModelView(AbstractModelView):
 
         queryset = filters.filter(queryset)
         return queryset
-
-    def get_path(self) -> str:
-        if self.detail:
-            return f"/{{id}}/{utils.to_snake_case(self.related_model.__name__)}s/"
-        else:
-            return "/"
@@ -1,5 +1,6 @@
 from typing import Callable, List, Optional, Type
 
+from django.core.cache.backends.base import BaseCache
 from ninja import Schema
 
 from ninja_crud.views.update import PostSaveHook, PreSaveHook, UpdateModelView
@@ -13,6 +14,7 @@ class PatchModelView(UpdateModelView):
         decorators: List[Callable] = None,
         pre_save: PreSaveHook = None,
         post_save: PostSaveHook = None,
+        cache: Optional[BaseCache] = None,
         router_kwargs: Optional[dict] = None,
     ) -> None:
         optional_input_schema = self.generate_partial_schema(input_schema)
@@ -22,6 +24,7 @@ class PatchModelView(UpdateModelView):
             decorators=decorators,
             pre_save=pre_save,
             post_save=post_save,
+            cache=cache,
             router_kwargs=router_kwargs,
         )
         self.http_method = "PATCH"
@@ -1,7 +1,8 @@
-from http import HTTPStatus
-from typing import Any, Callable, List, Optional, Type
+import inspect
+from typing import Any, Callable, List, Optional, Type, Union
 
-from django.db.models import Model, QuerySet
+from django.core.cache.backends.base import BaseCache
+from django.db.models import Model, Prefetch, QuerySet
 from django.http import HttpRequest
 from ninja import Router, Schema
 
@@ -9,37 +10,105 @@ from ninja_crud.views import utils
 from ninja_crud.views.abstract import AbstractModelView
 
 
+def _takes_arguments(func: Callable) -> bool:
+    try:
+        return bool(inspect.signature(func).parameters)
+    except (TypeError, ValueError):
+        return True
+
+
 class RetrieveModelView(AbstractModelView):
     def __init__(
         self,
         output_schema: Type[Schema],
-        queryset_getter: Callable[[Any], QuerySet[Model]] = None,
+        queryset_getter: Union[
+            Callable[[], QuerySet[Model]], Callable[[Any], QuerySet[Model]]
+        ] = None,
+        reuse_queryset: bool = False,
+        select_related: List[str] = None,
+        prefetch_related: List[str] = None,
+        prefetch_objects: List[Prefetch] = None,
+        use_only: bool = False,
+        cache: Optional[BaseCache] = None,
+        cache_ttl: int = 60,
         decorators: List[Callable] = None,
         router_kwargs: Optional[dict] = None,
     ) -> None:
         super().__init__(decorators=decorators, router_kwargs=router_kwargs)
         self.output_schema = output_schema
         self.queryset_getter = queryset_getter
+        self.reuse_queryset = reuse_queryset
+        self._getter_takes_id = queryset_getter is not None and _takes_arguments(
+            queryset_getter
+        )
+        self._queryset_template: Optional[QuerySet[Model]] = None
+        self.select_related = select_related or []
+        self.prefetch_related = prefetch_related or []
+        self.prefetch_objects = prefetch_objects or []
+        self.use_only = use_only
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self._path = "/{id}"
 
     def register_route(self, router: Router, model_class: Type[Model]) -> None:
+        operation_id, summary = utils.get_route_meta("retrieve", model_class)
+
+        get_queryset = self.get_queryset
+        output_schema = self.output_schema
+        cache = self.cache
+        cache_ttl = self.cache_ttl
+        schema_name = utils.get_schema_name(output_schema)
+
         @router.get(
             path=self.get_path(),
-            response=self.output_schema,
-            operation_id=f"retrieve_{utils.to_snake_case(model_class.__name__)}",
-            summary=f"Retrieve {model_class.__name__}",
+            response=output_schema,
+            operation_id=operation_id,
+            summary=summary,
             **self.router_kwargs,
         )
-        @utils.merge_decorators(self.decorators)
+        @self._merged_decorator
         def retrieve_model(request: HttpRequest, id: utils.get_id_type(model_class)):
-            queryset = self.get_queryset(model_class, id)
-            instance = queryset.get(pk=id)
-            return HTTPStatus.OK, instance
+            if cache is None:
+                instance = get_queryset(model_class, id).get(pk=id)
+                return 200, instance
+
+            cache_key = utils.get_cache_key(model_class, id)
+            cached_data = cache.get(cache_key) or {}
+            data = cached_data.get(schema_name)
+            if data is None:
+                instance = get_queryset(model_class, id).get(pk=id)
+                data = output_schema.from_orm(instance).dict(by_alias=True)
+                cached_data[schema_name] = data
+                cache.set(cache_key, cached_data, cache_ttl)
+            return 200, data
 
     def get_queryset(self, model_class: Type[Model], id: Any = None) -> QuerySet[Model]:
         if self.queryset_getter is None:
-            return model_class.objects.get_queryset()
+            queryset = model_class._default_manager.get_queryset()
+        elif self._getter_takes_id:
+            queryset = self.queryset_getter(id)
+        elif self.reuse_queryset:
+            if self._queryset_template is None:
+                self._queryset_template = self.queryset_getter()
+            queryset = self._queryset_template.all()
         else:
-            return self.queryset_getter(id)
+            queryset = self.queryset_getter()
+
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if self.prefetch_objects:
+            queryset = queryset.prefetch_related(*self.prefetch_objects)
+        if self.use_only:
+            related_lookups = self.select_related + self.prefetch_related
+            related_lookups += [obj.prefetch_through for obj in self.prefetch_objects]
+            only_fields = utils.get_only_fields(
+                queryset.model, self.output_schema, tuple(related_lookups)
+            )
+            queryset = queryset.only(*only_fields)
+        return queryset
 
-    def get_path(self) -> str:
-        return "/{id}"
+    def invalidate(self, model_class: Type[Model], id: Any) -> None:
+        if self.cache is not None:
+            utils.invalidate_cache(self.cache, model_class, id)
@@ -1,7 +1,7 @@
 import copy
-from http import HTTPStatus
 from typing import Callable, List, Optional, Type, TypeVar
 
+from django.core.cache.backends.base import BaseCache
 from django.db.models import Model
 from django.http import HttpRequest
 from ninja import Router, Schema
@@ -22,6 +22,7 @@ class UpdateModelView(AbstractModelView):
         decorators: List[Callable] = None,
         pre_save: PreSaveHook = None,
         post_save: PostSaveHook = None,
+        cache: Optional[BaseCache] = None,
         router_kwargs: Optional[dict] = None,
     ) -> None:
         super().__init__(decorators=decorators, router_kwargs=router_kwargs)
@@ -29,27 +30,31 @@ class UpdateModelView(AbstractModelView):
         self.output_schema = output_schema
         self.pre_save = pre_save
         self.post_save = post_save
+        self.cache = cache
         self.http_method = "PUT"
+        self._path = "/{id}"
 
     def register_route(self, router: Router, model_class: Type[Model]) -> None:
+        operation_id, summary = utils.get_route_meta("update", model_class)
+
         input_schema = self.input_schema
         output_schema = self.output_schema
 
         @router.api_operation(
             methods=[self.http_method],
             path=self.get_path(),
-            response={HTTPStatus.OK: output_schema},
-            operation_id=f"update_{utils.to_snake_case(model_class.__name__)}",
-            summary=f"Update {model_class.__name__}",
+            response={200: output_schema},
+            operation_id=operation_id,
+            summary=summary,
             **self.router_kwargs,
         )
-        @utils.merge_decorators(self.decorators)
+        @self._merged_decorator
         def update_model(
             request: HttpRequest,
             id: utils.get_id_type(model_class),
             payload: input_schema,
         ):
-            instance = model_class.objects.get(pk=id)
+            instance = model_class._default_manager.get(pk=id)
 
             old_instance = None
             if self.pre_save is not None or self.post_save is not None:
@@ -64,10 +69,10 @@ class UpdateModelView(AbstractModelView):
             instance.full_clean()
             instance.save()
 
+            if self.cache is not None:
+                utils.invalidate_cache(self.cache, model_class, instance.pk)
+
             if self.post_save is not None:
                 self.post_save(request, instance, old_instance)
 
-            return HTTPStatus.OK, instance
-
-    def get_path(self) -> str:
-        return "/{id}"
+            return 200, instance
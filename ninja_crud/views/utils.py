@@ -1,23 +1,95 @@
+import functools
 import re
-from typing import Type
+from typing import Any, Tuple, Type
 from uuid import UUID
 
+from django.core.cache.backends.base import BaseCache
 from django.db.models import Model
+from ninja import Schema
 
 
+@functools.lru_cache(maxsize=None)
 def to_snake_case(name: str, separator: str = "_"):
     return re.sub(r"(?<!^)(?=[A-Z])", separator, name).lower()
 
 
+@functools.lru_cache(maxsize=None)
+def get_route_meta(
+    verb: str,
+    model_class: Type[Model],
+    plural: bool = False,
+    related_model: Type[Model] = None,
+) -> Tuple[str, str]:
+    suffix = "s" if plural else ""
+    if related_model is None:
+        operation_id = f"{verb}_{to_snake_case(model_class.__name__)}{suffix}"
+        summary = f"{verb.capitalize()} {model_class.__name__}{suffix}"
+        return operation_id, summary
+
+    parent_model_name = to_snake_case(model_class.__name__)
+    related_model_name = to_snake_case(related_model.__name__)
+    operation_id = f"{verb}_{parent_model_name}_{related_model_name}{suffix}"
+    summary = f"{verb.capitalize()} {related_model.__name__}{suffix}"
+    if plural:
+        summary += f" of a {model_class.__name__}"
+    return operation_id, summary
+
+
+@functools.lru_cache(maxsize=None)
+def get_only_fields(
+    model_class: Type[Model],
+    schema_class: Type[Schema],
+    related_lookups: Tuple[str, ...] = (),
+) -> Tuple[str, ...]:
+    field_names = {}
+    for field in model_class._meta.concrete_fields:
+        field_names[field.name] = field.name
+        field_names[field.attname] = field.name
+
+    only_fields = {model_class._meta.pk.name}
+    for schema_field in schema_class.__fields__.values():
+        for name in (schema_field.name, schema_field.alias):
+            root_name = name.split(".")[0].split("__")[0]
+            if root_name in field_names:
+                only_fields.add(field_names[root_name])
+    for lookup in related_lookups:
+        root_name = lookup.split("__")[0]
+        if root_name in field_names:
+            only_fields.add(field_names[root_name])
+
+    return tuple(sorted(only_fields))
+
+
+def get_schema_name(schema_class: Type[Schema]) -> str:
+    return f"{schema_class.__module__}.{schema_class.__qualname__}"
+
+
+def get_cache_key(model_class: Type[Model], id: Any) -> str:
+    return f"{model_class._meta.label}:{id}"
+
+
+def invalidate_cache(cache: BaseCache, model_class: Type[Model], id: Any) -> None:
+    cache.delete(get_cache_key(model_class, id))
+
+
+def _identity(func):
+    return func
+
+
 def merge_decorators(decorators):
+    decorators = tuple(reversed(decorators))
+    if not decorators:
+        return _identity
+    if len(decorators) == 1:
+        return decorators[0]
+
     def merged_decorator(func):
-        for decorator in reversed(decorators):
-            func = decorator(func)
-        return func
+        return functools.reduce(lambda f, decorator: decorator(f), decorators, func)
 
     return merged_decorator
 
 
+@functools.lru_cache(maxsize=None)
 def get_id_type(model_class: Type[Model]) -> Type:  # pragma: no cover
     id_field = model_class._meta.pk
     id_internal_type = id_field.get_internal_type()
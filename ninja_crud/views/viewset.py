@@ -1,46 +1,63 @@
 from __future__ import annotations
 
-from typing import Type
+import weakref
+from typing import Dict, Type
 
 from django.db.models import Model
 from ninja import Router
 
 from ninja_crud.views import AbstractModelView
 
+_MISSING = object()
 
-class ModelViewSetMeta(type):
-    @staticmethod
-    def validate_model_class(
-        new_cls: ModelViewSetMeta,
-    ):  # pragma: no cover
+
+class ModelViewSet:
+    model_class: Type[Model]
+    _model_views: Dict[str, AbstractModelView] = {}
+    _registered_routers: weakref.WeakSet[Router] = weakref.WeakSet()
+    _validated: bool = False
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._collect_model_views()
+        cls._registered_routers = weakref.WeakSet()
+        cls._validated = False
+
+    @classmethod
+    def _validate_model_class(cls) -> None:
         cls_attr_name = "model_class"
-        if not hasattr(new_cls, cls_attr_name):
+        cls_attr_value = getattr(cls, cls_attr_name, _MISSING)
+        if cls_attr_value is _MISSING:
             raise ValueError(
-                f"{new_cls.__name__}.{cls_attr_name} class attribute must be set"
+                f"{cls.__name__}.{cls_attr_name} class attribute must be set"
             )
-        cls_attr_value = getattr(new_cls, cls_attr_name)
         if not isinstance(cls_attr_value, type) or not issubclass(
             cls_attr_value, Model
         ):
             raise ValueError(
-                f"{new_cls.__name__}.{cls_attr_name} must be a subclass of django.db.models.Model"
+                f"{cls.__name__}.{cls_attr_name} must be a subclass of django.db.models.Model"
             )
 
-    def __new__(mcs, name, bases, attrs):
-        new_cls = super().__new__(mcs, name, bases, attrs)
-
-        if name != "ModelViewSet":
-            mcs.validate_model_class(new_cls)
-
-        return new_cls
-
-
-class ModelViewSet(metaclass=ModelViewSetMeta):
-    model_class: Type[Model]
+    @classmethod
+    def _collect_model_views(cls) -> None:
+        model_views: Dict[str, AbstractModelView] = {}
+        for base in reversed(cls.__mro__):
+            for attr_name, attr_value in vars(base).items():
+                if isinstance(attr_value, AbstractModelView):
+                    model_views[attr_name] = attr_value
+                else:
+                    model_views.pop(attr_name, None)
+        cls._model_views = model_views
 
     @classmethod
     def register_routes(cls, router: Router) -> None:
-        for attr_name in dir(cls):
-            attr_value = getattr(cls, attr_name)
-            if isinstance(attr_value, AbstractModelView):
-                attr_value.register_route(router, cls.model_class)
+        if not cls._validated:
+            cls._validate_model_class()
+            cls._validated = True
+
+        if router in cls._registered_routers:
+            return
+
+        for model_view in cls._model_views.values():
+            model_view.register_route(router, cls.model_class)
+        cls._registered_routers.add(router)
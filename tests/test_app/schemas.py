@@ -35,6 +35,10 @@ class ItemOut(Identifiable, Representable):
     collection_id: UUID
 
 
+class ItemDetailOut(ItemOut):
+    collection: CollectionOut
+
+
 class UserIn(Schema):
     username: str
     email: str
@@ -3,6 +3,7 @@ import uuid
 
 from ninja_crud.tests import (
     AuthHeaders,
+    BatchRetrieveModelViewTest,
     CreateModelViewTest,
     DeleteModelViewTest,
     ListModelViewTest,
@@ -60,6 +61,16 @@ class CollectionViewSetTest(ModelViewSetTest, BaseTestCase):
         path_parameters=get_path_parameters,
         auth_headers=get_auth_headers_ok,
     )
+    test_batch_retrieve = BatchRetrieveModelViewTest(
+        query_parameters=lambda self: QueryParameters(
+            ok=[
+                {"ids": [self.collection_1.id, self.collection_2.id]},
+                {"ids": [self.collection_1.id, uuid.uuid4()]},
+            ],
+            bad_request={"ids": ["not-a-uuid"]},
+        ),
+        auth_headers=get_auth_headers_ok,
+    )
     test_update = UpdateModelViewTest(
         path_parameters=get_path_parameters,
         auth_headers=get_auth_headers_ok_forbidden,
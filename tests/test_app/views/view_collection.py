@@ -6,6 +6,7 @@ from django.http import HttpRequest
 from ninja import Router
 
 from ninja_crud.views import (
+    BatchRetrieveModelView,
     CreateModelView,
     DeleteModelView,
     ListModelView,
@@ -51,6 +52,7 @@ class CollectionViewSet(ModelViewSet):
         post_save=lambda request, instance: None,
     )
     retrieve = RetrieveModelView(output_schema=output_schema)
+    batch_retrieve = BatchRetrieveModelView(output_schema=output_schema)
     update = UpdateModelView(
         input_schema=input_schema,
         output_schema=output_schema,
@@ -0,0 +1,31 @@
+from django.test import TestCase
+
+from ninja_crud.views import AbstractModelView, RetrieveModelView
+from tests.test_app.schemas import ItemOut
+
+
+class AbstractModelViewTest(TestCase):
+    def test_get_path_not_set(self):
+        class CustomModelView(AbstractModelView):
+            def register_route(self, router, model_class):
+                pass
+
+        with self.assertRaises(NotImplementedError):
+            CustomModelView().get_path()
+
+    def test_merged_decorator_follows_decorators(self):
+        def tag(name):
+            def decorator(func):
+                return lambda: [name] + func()
+
+            return decorator
+
+        model_view = RetrieveModelView(output_schema=ItemOut, decorators=[tag("a")])
+        merged_decorator = model_view._merged_decorator
+        self.assertIs(model_view._merged_decorator, merged_decorator)
+
+        model_view.decorators.append(tag("b"))
+        self.assertEqual(model_view._merged_decorator(lambda: [])(), ["a", "b"])
+
+        model_view.decorators = []
+        self.assertEqual(model_view._merged_decorator(lambda: [])(), [])
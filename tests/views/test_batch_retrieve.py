@@ -0,0 +1,59 @@
+import uuid
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from ninja import Router
+from ninja.testing import TestClient
+
+from ninja_crud.views import BatchRetrieveModelView
+from tests.test_app.models import Collection, Item
+from tests.test_app.schemas import ItemOut
+
+
+class BatchRetrieveModelViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(username="user")
+        collection = Collection.objects.create(name="collection", created_by=user)
+        cls.item_1 = Item.objects.create(name="item-1", collection=collection)
+        cls.item_2 = Item.objects.create(name="item-2", collection=collection)
+
+    def test_batch_retrieve_models(self):
+        item_1, item_2 = self.item_1, self.item_2
+        router = Router()
+        BatchRetrieveModelView(
+            output_schema=ItemOut, select_related=["collection"]
+        ).register_route(router, Item)
+        client = TestClient(router)
+
+        with self.assertNumQueries(1):
+            response = client.get(f"/batch/?ids={item_2.id}&ids={item_1.id}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [item["id"] for item in response.json()], [str(item_2.id), str(item_1.id)]
+        )
+
+    def test_batch_retrieve_models_skips_unknown_ids(self):
+        router = Router()
+        BatchRetrieveModelView(output_schema=ItemOut).register_route(router, Item)
+        client = TestClient(router)
+
+        response = client.get(f"/batch/?ids={uuid.uuid4()}&ids={self.item_1.id}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [item["id"] for item in response.json()], [str(self.item_1.id)]
+        )
+
+    def test_batch_retrieve_models_max_batch_size(self):
+        router = Router()
+        BatchRetrieveModelView(output_schema=ItemOut, max_batch_size=1).register_route(
+            router, Item
+        )
+        client = TestClient(router)
+
+        with self.assertNumQueries(0):
+            response = client.get(f"/batch/?ids={self.item_1.id}&ids={self.item_2.id}")
+
+        self.assertEqual(response.status_code, 422)
@@ -1,13 +1,24 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.db import models
 from django.test import TestCase
+from ninja import Router
+from ninja.testing import TestClient
 
-from ninja_crud.views import DeleteModelView
+from ninja_crud.views import DeleteModelView, RetrieveModelView
 from tests.test_app.models import Collection, Item
+from tests.test_app.schemas import ItemOut
 
 
 class DeleteModelViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(username="user")
+        collection = Collection.objects.create(name="collection", created_by=user)
+        cls.item = Item.objects.create(name="item", collection=collection)
+
     def test_register_route_router_kwargs(self):
         router_mock = MagicMock()
         model_view = DeleteModelView(router_kwargs={"exclude_unset": True})
@@ -16,3 +27,30 @@ class DeleteModelViewTest(TestCase):
 
         router_mock.delete.assert_called_once()
         self.assertTrue(router_mock.delete.call_args[1]["exclude_unset"])
+
+    def test_delete_model_invalidates_cache(self):
+        router = Router()
+        RetrieveModelView(output_schema=ItemOut, cache=cache).register_route(
+            router, Item
+        )
+        DeleteModelView(cache=cache).register_route(router, Item)
+        client = TestClient(router)
+        self.addCleanup(cache.clear)
+
+        client.get(f"/{self.item.id}")
+        response = client.delete(f"/{self.item.id}")
+
+        self.assertEqual(response.status_code, 204)
+        with self.assertRaises(Item.DoesNotExist):
+            client.get(f"/{self.item.id}")
+
+    def test_delete_model_uses_default_manager(self):
+        router = Router()
+        DeleteModelView().register_route(router, Item)
+        client = TestClient(router)
+
+        with patch.object(Item, "objects", None):
+            response = client.delete(f"/{self.item.id}")
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Item.objects.filter(pk=self.item.pk).exists())
@@ -33,3 +33,12 @@ class ListModelViewTest(TestCase):
 
         router_mock.get.assert_called_once()
         self.assertTrue(router_mock.get.call_args[1]["exclude_none"])
+
+    def test_get_path(self):
+        collection_view = ListModelView(output_schema=ItemOut)
+        instance_view = ListModelView(
+            output_schema=ItemOut, detail=True, related_model=Item
+        )
+
+        self.assertEqual(collection_view.get_path(), "/")
+        self.assertEqual(instance_view.get_path(), "/{id}/items/")
@@ -1,14 +1,26 @@
-from unittest.mock import MagicMock
+import inspect
+from unittest.mock import MagicMock, patch
 
+from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.db import models
+from django.db.models import Prefetch
 from django.test import TestCase
+from ninja import Router
+from ninja.testing import TestClient
 
 from ninja_crud.views import RetrieveModelView
-from tests.test_app.models import Item
-from tests.test_app.schemas import ItemOut
+from tests.test_app.models import Collection, Item, Tag
+from tests.test_app.schemas import ItemDetailOut, ItemOut
 
 
 class RetrieveModelViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(username="user")
+        collection = Collection.objects.create(name="collection", created_by=user)
+        cls.item = Item.objects.create(name="item", collection=collection)
+
     def test_register_route_router_kwargs(self):
         router_mock = MagicMock()
         model_view = RetrieveModelView(
@@ -20,3 +32,145 @@ class RetrieveModelViewTest(TestCase):
 
         router_mock.get.assert_called_once()
         self.assertTrue(router_mock.get.call_args[1]["exclude_unset"])
+
+    def test_retrieve_model_uses_default_manager(self):
+        router = Router()
+        RetrieveModelView(output_schema=ItemOut).register_route(router, Item)
+        client = TestClient(router)
+
+        with patch.object(Item, "objects", None), self.assertNumQueries(1):
+            response = client.get(f"/{self.item.id}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["id"], str(self.item.id))
+
+    def test_get_queryset_returns_queryset(self):
+        model_view = RetrieveModelView(output_schema=ItemOut)
+
+        queryset = model_view.get_queryset(Item, id=None)
+
+        self.assertIsInstance(queryset, models.QuerySet)
+        self.assertEqual(queryset.model, Item)
+
+    def test_get_queryset_preserves_queryset_getter(self):
+        model_view = RetrieveModelView(
+            output_schema=ItemOut,
+            queryset_getter=lambda id: Item.objects.select_related("collection"),
+        )
+
+        queryset = model_view.get_queryset(Item, id=None)
+
+        self.assertEqual(queryset.query.select_related, {"collection": {}})
+
+    def test_get_queryset_select_and_prefetch_related(self):
+        model_view = RetrieveModelView(
+            output_schema=ItemOut,
+            select_related=["collection"],
+            prefetch_related=["tags"],
+        )
+
+        queryset = model_view.get_queryset(Item, id=None)
+
+        self.assertEqual(queryset.query.select_related, {"collection": {}})
+        self.assertEqual(queryset._prefetch_related_lookups, ("tags",))
+
+    def test_get_queryset_use_only(self):
+        model_view = RetrieveModelView(
+            output_schema=ItemOut,
+            select_related=["collection"],
+            use_only=True,
+        )
+
+        queryset = model_view.get_queryset(Item, id=None)
+
+        only_fields, defer = queryset.query.deferred_loading
+        self.assertFalse(defer)
+        self.assertEqual(set(only_fields), {"id", "name", "description", "collection"})
+
+    def test_retrieve_model_cache(self):
+        router = Router()
+        model_view = RetrieveModelView(output_schema=ItemOut, cache=cache)
+        model_view.register_route(router, Item)
+        client = TestClient(router)
+        self.addCleanup(cache.clear)
+
+        with self.assertNumQueries(1):
+            response = client.get(f"/{self.item.id}")
+        with self.assertNumQueries(0):
+            cached_response = client.get(f"/{self.item.id}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(cached_response.json(), response.json())
+
+        model_view.invalidate(Item, self.item.id)
+        with self.assertNumQueries(1):
+            client.get(f"/{self.item.id}")
+
+    def test_get_queryset_getter_without_id(self):
+        calls = []
+        model_view = RetrieveModelView(
+            output_schema=ItemOut,
+            queryset_getter=lambda: calls.append(None) or Item.objects.all(),
+        )
+
+        model_view.get_queryset(Item, id=1)
+        model_view.get_queryset(Item, id=2)
+
+        self.assertEqual(len(calls), 2)
+
+    def test_get_queryset_getter_without_id_reuse_queryset(self):
+        template = Item.objects.all()
+        calls = []
+        model_view = RetrieveModelView(
+            output_schema=ItemOut,
+            queryset_getter=lambda: calls.append(None) or template,
+            reuse_queryset=True,
+        )
+
+        model_view.get_queryset(Item, id=1)
+        queryset = model_view.get_queryset(Item, id=2)
+
+        self.assertEqual(len(calls), 1)
+        self.assertIsNot(queryset, template)
+
+    def test_get_queryset_getter_without_signature(self):
+        ids = []
+        with patch.object(inspect, "signature", side_effect=ValueError):
+            model_view = RetrieveModelView(
+                output_schema=ItemOut,
+                queryset_getter=lambda id: ids.append(id) or Item.objects.all(),
+            )
+
+        model_view.get_queryset(Item, id=1)
+
+        self.assertEqual(ids, [1])
+
+    def test_get_queryset_prefetch_objects(self):
+        prefetch = Prefetch("tags", queryset=Tag.objects.filter(name="tag"))
+        model_view = RetrieveModelView(
+            output_schema=ItemOut, prefetch_objects=[prefetch], use_only=True
+        )
+
+        queryset = model_view.get_queryset(Item, id=None)
+
+        self.assertEqual(queryset._prefetch_related_lookups, (prefetch,))
+        self.assertIn("id", queryset.query.deferred_loading[0])
+
+    def test_retrieve_model_cache_per_output_schema(self):
+        flat_router = Router()
+        RetrieveModelView(output_schema=ItemOut, cache=cache).register_route(
+            flat_router, Item
+        )
+        nested_router = Router()
+        RetrieveModelView(output_schema=ItemDetailOut, cache=cache).register_route(
+            nested_router, Item
+        )
+        self.addCleanup(cache.clear)
+
+        flat_response = TestClient(flat_router).get(f"/{self.item.id}")
+        nested_response = TestClient(nested_router).get(f"/{self.item.id}")
+
+        self.assertEqual(flat_response.status_code, 200)
+        self.assertNotIn("collection", flat_response.json())
+        self.assertEqual(nested_response.status_code, 200)
+        self.assertEqual(nested_response.json()["collection"]["name"], "collection")
@@ -1,14 +1,24 @@
 from unittest.mock import MagicMock
 
+from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.db import models
 from django.test import TestCase
+from ninja import Router
+from ninja.testing import TestClient
 
-from ninja_crud.views import UpdateModelView
-from tests.test_app.models import Item
-from tests.test_app.schemas import ItemIn, ItemOut
+from ninja_crud.views import RetrieveModelView, UpdateModelView
+from tests.test_app.models import Collection, Item
+from tests.test_app.schemas import ItemDetailOut, ItemIn, ItemOut
 
 
 class UpdateModelViewTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(username="user")
+        collection = Collection.objects.create(name="collection", created_by=user)
+        cls.item = Item.objects.create(name="item", collection=collection)
+
     def test_register_route_router_kwargs(self):
         router_mock = MagicMock()
         model_view = UpdateModelView(
@@ -21,3 +31,20 @@ class UpdateModelViewTest(TestCase):
 
         router_mock.api_operation.assert_called_once()
         self.assertTrue(router_mock.api_operation.call_args[1]["exclude_unset"])
+
+    def test_update_model_invalidates_cache(self):
+        router = Router()
+        RetrieveModelView(output_schema=ItemDetailOut, cache=cache).register_route(
+            router, Item
+        )
+        UpdateModelView(
+            input_schema=ItemIn, output_schema=ItemOut, cache=cache
+        ).register_route(router, Item)
+        client = TestClient(router)
+        self.addCleanup(cache.clear)
+
+        client.get(f"/{self.item.id}")
+        client.put(f"/{self.item.id}", json={"name": "new-name"})
+        response = client.get(f"/{self.item.id}")
+
+        self.assertEqual(response.json()["name"], "new-name")
@@ -0,0 +1,37 @@
+from django.test import TestCase
+
+from ninja_crud.views import utils
+from tests.test_app.models import Collection, Item
+
+
+class UtilsTest(TestCase):
+    def test_merge_decorators(self):
+        def tag(name):
+            def decorator(func):
+                return lambda: [name] + func()
+
+            return decorator
+
+        def func():
+            return []
+
+        self.assertIs(utils.merge_decorators([])(func), func)
+        self.assertEqual(utils.merge_decorators([tag("a")])(func)(), ["a"])
+        self.assertEqual(
+            utils.merge_decorators([tag("a"), tag("b"), tag("c")])(func)(),
+            ["a", "b", "c"],
+        )
+
+    def test_get_route_meta(self):
+        self.assertEqual(
+            utils.get_route_meta("list", Item, plural=True),
+            ("list_items", "List Items"),
+        )
+        self.assertEqual(
+            utils.get_route_meta("create", Collection, related_model=Item),
+            ("create_collection_item", "Create Item"),
+        )
+        self.assertEqual(
+            utils.get_route_meta("list", Collection, plural=True, related_model=Item),
+            ("list_collection_items", "List Items of a Collection"),
+        )
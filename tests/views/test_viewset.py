@@ -0,0 +1,91 @@
+from unittest.mock import MagicMock
+
+from django.test import TestCase
+
+from ninja_crud.views import DeleteModelView, ModelViewSet, RetrieveModelView
+from tests.test_app.models import Item
+from tests.test_app.schemas import ItemOut
+
+
+class ModelViewSetTest(TestCase):
+    def test_register_routes_inherited_model_views(self):
+        class BaseItemViewSet(ModelViewSet):
+            model_class = Item
+
+            retrieve = RetrieveModelView(output_schema=ItemOut)
+            delete = DeleteModelView()
+
+        class ItemViewSet(BaseItemViewSet):
+            delete = None
+
+        router_mock = MagicMock()
+        ItemViewSet.register_routes(router_mock)
+
+        self.assertEqual(list(ItemViewSet._model_views), ["retrieve"])
+        router_mock.get.assert_called_once()
+        router_mock.delete.assert_not_called()
+
+    def test_register_routes_mixin_model_views(self):
+        class RetrieveMixin:
+            retrieve = RetrieveModelView(output_schema=ItemOut)
+
+        class ItemViewSet(ModelViewSet, RetrieveMixin):
+            model_class = Item
+
+        router_mock = MagicMock()
+        ItemViewSet.register_routes(router_mock)
+
+        self.assertEqual(list(ItemViewSet._model_views), ["retrieve"])
+        router_mock.get.assert_called_once()
+
+    def test_register_routes_diamond_override(self):
+        class BaseItemViewSet(ModelViewSet):
+            model_class = Item
+
+            retrieve = RetrieveModelView(output_schema=ItemOut)
+
+        class NoRetrieveItemViewSet(BaseItemViewSet):
+            retrieve = None
+
+        class DeleteItemViewSet(BaseItemViewSet):
+            delete = DeleteModelView()
+
+        class ItemViewSet(NoRetrieveItemViewSet, DeleteItemViewSet):
+            pass
+
+        router_mock = MagicMock()
+        ItemViewSet.register_routes(router_mock)
+
+        self.assertIsNone(ItemViewSet.retrieve)
+        self.assertEqual(list(ItemViewSet._model_views), ["delete"])
+        router_mock.get.assert_not_called()
+        router_mock.delete.assert_called_once()
+
+    def test_register_routes_once_per_router(self):
+        class ItemViewSet(ModelViewSet):
+            model_class = Item
+
+            retrieve = RetrieveModelView(output_schema=ItemOut)
+
+        router_mock = MagicMock()
+        ItemViewSet.register_routes(router_mock)
+        ItemViewSet.register_routes(router_mock)
+        router_mock.get.assert_called_once()
+
+        other_router_mock = MagicMock()
+        ItemViewSet.register_routes(other_router_mock)
+        other_router_mock.get.assert_called_once()
+
+    def test_model_class_must_be_set(self):
+        class ItemViewSet(ModelViewSet):
+            retrieve = RetrieveModelView(output_schema=ItemOut)
+
+        with self.assertRaises(ValueError):
+            ItemViewSet.register_routes(MagicMock())
+
+    def test_model_class_must_be_a_model(self):
+        class ItemViewSet(ModelViewSet):
+            model_class = ItemOut
+
+        with self.assertRaises(ValueError):
+            ItemViewSet.register_routes(MagicMock())